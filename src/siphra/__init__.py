@@ -22,6 +22,7 @@ from siphra.types import (
     EntryType,
     LedgerId,
     Metadata,
+    MinorUnits,
     MoneyAmount,
     TransactionId,
     TransactionStatus,
@@ -49,6 +50,7 @@ __all__ = [
     "Ledger",
     "LedgerId",
     "Metadata",
+    "MinorUnits",
     "MoneyAmount",
     "SiphraError",
     "StorageError",
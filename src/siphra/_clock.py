@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+
+_now: ContextVar[datetime | None] = ContextVar("siphra_now", default=None)
+
+
+def current_now() -> datetime:
+    now = _now.get()
+    return datetime.now(UTC) if now is None else now
+
+
+@contextmanager
+def frozen() -> Iterator[datetime]:
+    now = current_now()
+    token = _now.set(now)
+    try:
+        yield now
+    finally:
+        _now.reset(token)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from siphra.exceptions import ValidationError
+
+
+def as_uuid(value: Any, name: str) -> UUID:
+    if isinstance(value, UUID):
+        return value
+    try:
+        return UUID(str(value))
+    except ValueError:
+        raise ValidationError(f"Invalid {name}: {value!r}") from None
+
+
+def as_decimal(value: Any, name: str) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        raise ValidationError(f"Invalid {name}: {value!r}") from None
+
+
+def as_member[E: Enum](enum: type[E], value: Any) -> E:
+    if isinstance(value, enum):
+        return value
+    try:
+        return enum(value)
+    except ValueError:
+        raise ValidationError(f"Invalid {enum.__name__}: {value!r}") from None
@@ -1,29 +1,47 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import sys
+from dataclasses import dataclass, field, replace
+from datetime import datetime
 from decimal import Decimal
-from typing import Self
+from typing import Any, Self
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from siphra import _clock
+from siphra._coerce import as_member, as_uuid
+from siphra.currency import ZERO
+from siphra.exceptions import ValidationError
+from siphra.types import AccountId, AccountType, BalanceType, Metadata
 
-from siphra.types import AccountId, AccountType, BalanceType, Metadata, Timestamp
 
-
-class Account(BaseModel):
-    model_config = ConfigDict(frozen=True)
-
-    id: AccountId = Field(default_factory=lambda: AccountId(uuid4()))
-    code: str = Field(min_length=1, max_length=50)
-    name: str = Field(min_length=1, max_length=200)
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Account:
+    id: AccountId = field(default_factory=lambda: AccountId(uuid4()))
+    code: str
+    name: str
     account_type: AccountType
-    currency_code: str = Field(min_length=3, max_length=4)
-    description: str = Field(default="", max_length=1000)
+    currency_code: str
+    description: str = ""
     parent_id: AccountId | None = None
     is_active: bool = True
-    metadata: Metadata = Field(default_factory=dict)
-    created_at: Timestamp = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: Timestamp = Field(default_factory=lambda: datetime.now(UTC))
+    metadata: Metadata = field(default_factory=dict)
+    created_at: datetime = field(default_factory=_clock.current_now)
+    updated_at: datetime = field(default_factory=_clock.current_now)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "id", AccountId(as_uuid(self.id, "account id")))
+        if self.parent_id is not None:
+            object.__setattr__(self, "parent_id", AccountId(as_uuid(self.parent_id, "parent id")))
+        object.__setattr__(self, "account_type", as_member(AccountType, self.account_type))
+        if not 1 <= len(self.code) <= 50:
+            raise ValidationError(f"Account code must be 1-50 characters: {self.code!r}")
+        if not 1 <= len(self.name) <= 200:
+            raise ValidationError(f"Account name must be 1-200 characters: {self.name!r}")
+        if not 3 <= len(self.currency_code) <= 4:
+            raise ValidationError(f"Invalid currency code: {self.currency_code!r}")
+        object.__setattr__(self, "currency_code", sys.intern(self.currency_code.upper()))
+        if len(self.description) > 1000:
+            raise ValidationError("Account description exceeds 1000 characters")
 
     @property
     def normal_balance(self) -> BalanceType:
@@ -39,29 +57,27 @@ class Account(BaseModel):
         is_active: bool | None = None,
         metadata: Metadata | None = None,
     ) -> Self:
-        return self.model_copy(
-            update={
-                k: v
-                for k, v in {
-                    "name": name,
-                    "description": description,
-                    "is_active": is_active,
-                    "metadata": metadata,
-                    "updated_at": datetime.now(UTC),
-                }.items()
-                if v is not None
-            }
-        )
-
+        updates: dict[str, Any] = {
+            k: v
+            for k, v in {
+                "name": name,
+                "description": description,
+                "is_active": is_active,
+                "metadata": metadata,
+                "updated_at": _clock.current_now(),
+            }.items()
+            if v is not None
+        }
+        return replace(self, **updates)
 
-class AccountBalance(BaseModel):
-    model_config = ConfigDict(frozen=True)
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AccountBalance:
     account_id: AccountId
-    debit_total: Decimal = Decimal("0")
-    credit_total: Decimal = Decimal("0")
+    debit_total: Decimal = ZERO
+    credit_total: Decimal = ZERO
     currency_code: str
-    as_of: Timestamp = Field(default_factory=lambda: datetime.now(UTC))
+    as_of: datetime = field(default_factory=_clock.current_now)
 
     @property
     def balance(self) -> Decimal:
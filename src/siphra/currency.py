@@ -1,10 +1,35 @@
 from __future__ import annotations
 
+import sys
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
 from typing import ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from siphra.exceptions import ValidationError
+from siphra.types import MinorUnits
+
+DEFAULT_DECIMAL_PLACES = 8
+ZERO = Decimal("0")
+
+
+@lru_cache(maxsize=32)
+def _quantizer(decimal_places: int) -> Decimal:
+    return Decimal("0." + "0" * decimal_places if decimal_places > 0 else "0")
+
+
+@lru_cache(maxsize=32)
+def _smallest_unit(decimal_places: int) -> Decimal:
+    if decimal_places == 0:
+        return Decimal("1")
+    return Decimal(f"0.{'0' * (decimal_places - 1)}1")
+
+
+@lru_cache(maxsize=32)
+def _format_spec(decimal_places: int) -> str:
+    return f",.{decimal_places}f"
+
 
 class Currency(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -15,34 +40,63 @@ class Currency(BaseModel):
     decimal_places: int = Field(ge=0, le=18)
 
     def round_amount(self, amount: Decimal) -> Decimal:
-        quantize_str = "0." + "0" * self.decimal_places if self.decimal_places > 0 else "0"
-        return amount.quantize(Decimal(quantize_str), rounding=ROUND_HALF_UP)
+        return amount.quantize(_quantizer(self.decimal_places), rounding=ROUND_HALF_UP)
 
     def format_amount(self, amount: Decimal) -> str:
         rounded = self.round_amount(amount)
-        formatted = f"{rounded:,.{self.decimal_places}f}"
+        formatted = format(rounded, _format_spec(self.decimal_places))
         return f"{self.symbol}{formatted}" if self.symbol else formatted
 
     def smallest_unit(self) -> Decimal:
-        if self.decimal_places == 0:
-            return Decimal("1")
-        return Decimal(f"0.{'0' * (self.decimal_places - 1)}1")
+        return _smallest_unit(self.decimal_places)
+
+
+_CURRENCIES: dict[str, Currency] = {}
+_DECIMAL_PLACES: dict[str, int] = {}
+
+get_currency = _CURRENCIES.get
+
+
+def decimal_places_for(code: str) -> int:
+    return _DECIMAL_PLACES.get(code, DEFAULT_DECIMAL_PLACES)
 
 
 class CurrencyRegistry:
-    _currencies: ClassVar[dict[str, Currency]] = {}
+    _currencies: ClassVar[dict[str, Currency]] = _CURRENCIES
 
     @classmethod
     def get(cls, code: str) -> Currency | None:
-        return cls._currencies.get(code.upper())
+        return _CURRENCIES.get(code.upper())
 
     @classmethod
     def register(cls, currency: Currency) -> None:
-        cls._currencies[currency.code.upper()] = currency
+        code = sys.intern(currency.code.upper())
+        _CURRENCIES[code] = currency
+        _DECIMAL_PLACES[code] = currency.decimal_places
 
     @classmethod
     def all_currencies(cls) -> list[Currency]:
-        return list(cls._currencies.values())
+        return list(_CURRENCIES.values())
+
+
+def to_minor_units(amount: Decimal, decimal_places: int) -> MinorUnits:
+    sign, digits, exponent = amount.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValidationError(f"Invalid amount: {amount}")
+    coefficient = int("".join(map(str, digits)))
+    shift = exponent + decimal_places
+    minor: int
+    if shift >= 0:
+        minor = coefficient * 10**shift
+    else:
+        minor, remainder = divmod(coefficient, 10**-shift)
+        if remainder:
+            raise ValidationError(f"Amount {amount} has more than {decimal_places} decimal places")
+    return MinorUnits(-minor if sign else minor)
+
+
+def from_minor_units(minor: int, decimal_places: int) -> Decimal:
+    return Decimal(f"{minor}E-{decimal_places}")
 
 
 # Common currencies
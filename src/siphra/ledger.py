@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
+from itertools import chain
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
+from siphra import _clock
 from siphra.account import Account, AccountBalance
 from siphra.exceptions import (
     AccountNotFoundError,
@@ -105,24 +107,25 @@ class Ledger:
     ) -> Transaction:
         currency = currency_code or self._default_currency
 
-        for account_id, _ in debits + credits:
-            await self.get_account(account_id)
+        account_ids = [account_id for account_id, _ in chain(debits, credits)]
+        existing = await self._storage.accounts_exist(set(account_ids))
+        for account_id in account_ids:
+            if account_id not in existing:
+                raise AccountNotFoundError(account_id)
 
-        builder = TransactionBuilder(description, reference)
-        for account_id, amount in debits:
-            builder.debit(account_id, amount, currency)
-        for account_id, amount in credits:
-            builder.credit(account_id, amount, currency)
+        with _clock.frozen():
+            builder = TransactionBuilder(description, reference)
+            builder.debits(debits, currency).credits(credits, currency)
 
-        if effective_date:
-            builder.effective(effective_date)
-        if metadata:
-            for key, value in metadata.items():
-                builder.meta(key, value)
+            if effective_date:
+                builder.effective(effective_date)
+            if metadata:
+                for key, value in metadata.items():
+                    builder.meta(key, value)
 
-        transaction = builder.build()
-        if auto_post:
-            transaction = transaction.post()
+            transaction = builder.build()
+            if auto_post:
+                transaction = transaction.post()
 
         await self._storage.save_transaction(transaction)
         return transaction
@@ -155,13 +158,14 @@ class Ledger:
     ) -> Transaction:
         original = await self.get_transaction(transaction_id)
 
-        if original.status != TransactionStatus.POSTED:
+        if original.status is not TransactionStatus.POSTED:
             raise ImmutableTransactionError(transaction_id)
 
-        reversal = original.reverse(
-            description=f"Void: {original.description}" + (f" - {reason}" if reason else "")
-        )
-        reversal = reversal.post()
+        with _clock.frozen():
+            reversal = original.reverse(
+                description=f"Void: {original.description}" + (f" - {reason}" if reason else "")
+            )
+            reversal = reversal.post()
 
         # Keep original POSTED so both count in balance (netting to zero)
         marked_original = original.model_copy(
@@ -175,15 +179,14 @@ class Ledger:
             }
         )
 
-        await self._storage.save_transaction(marked_original)
-        await self._storage.save_transaction(reversal)
+        await self._storage.save_transactions([marked_original, reversal])
         return reversal
 
     async def get_balance(self, account_id: AccountId, as_of: datetime | None = None) -> Decimal:
         account = await self.get_account(account_id)
         balance_info = await self._storage.get_account_balance(account_id, as_of)
 
-        if account.normal_balance == BalanceType.DEBIT:
+        if account.normal_balance is BalanceType.DEBIT:
             return balance_info.debit_total - balance_info.credit_total
         return balance_info.credit_total - balance_info.debit_total
 
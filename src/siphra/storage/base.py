@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     from siphra.account import Account, AccountBalance
     from siphra.transaction import Transaction
     from siphra.types import AccountId, TransactionId
@@ -17,6 +20,11 @@ class StorageBackend(ABC):
     @abstractmethod
     async def get_account(self, account_id: AccountId) -> Account | None: ...
 
+    async def accounts_exist(self, account_ids: Iterable[AccountId]) -> set[AccountId]:
+        ids = list(account_ids)
+        accounts = await asyncio.gather(*(self.get_account(account_id) for account_id in ids))
+        return {account_id for account_id, a in zip(ids, accounts, strict=True) if a is not None}
+
     @abstractmethod
     async def get_account_by_code(self, code: str) -> Account | None: ...
 
@@ -31,6 +39,10 @@ class StorageBackend(ABC):
     @abstractmethod
     async def save_transaction(self, transaction: Transaction) -> None: ...
 
+    async def save_transactions(self, transactions: Sequence[Transaction]) -> None:
+        for transaction in transactions:
+            await self.save_transaction(transaction)
+
     @abstractmethod
     async def get_transaction(self, transaction_id: TransactionId) -> Transaction | None: ...
 
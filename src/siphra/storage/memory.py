@@ -1,20 +1,79 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort_left
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import UTC, datetime
-from decimal import Decimal
+from itertools import accumulate, islice
+from operator import attrgetter, itemgetter
 
 from siphra.account import Account, AccountBalance
+from siphra.currency import ZERO, from_minor_units
 from siphra.exceptions import AccountNotFoundError, DuplicateAccountError
 from siphra.storage.base import StorageBackend
 from siphra.transaction import Transaction
-from siphra.types import AccountId, EntryType, TransactionId, TransactionStatus
+from siphra.types import AccountId, TransactionId, TransactionStatus
+
+_date_key = itemgetter(0)
+_debit_key = itemgetter(1)
+_credit_key = itemgetter(2)
+_tx_date_key = attrgetter("effective_date")
+_code_key = attrgetter("code")
+
+
+def _posted_rows(transaction: Transaction) -> Iterator[tuple[datetime, int, int]]:
+    date = transaction.effective_date
+    columns = transaction.columns
+    for amount, is_debit in zip(columns.amounts_minor, columns.debit_flags, strict=True):
+        yield (date, amount, 0) if is_debit else (date, 0, amount)
+
+
+def _insert_account(accounts: list[Account], account: Account) -> None:
+    insort_left(accounts, account, key=_code_key)
+
+
+def _remove_account(accounts: list[Account], account: Account) -> None:
+    del accounts[bisect_left(accounts, account.code, key=_code_key)]
+
+
+def _place_transaction(
+    txs: list[Transaction],
+    previous: Transaction | None,
+    transaction: Transaction,
+    seq: dict[TransactionId, int],
+) -> None:
+    if previous is not None:
+        idx = bisect_left(txs, previous.effective_date, key=_tx_date_key)
+        while txs[idx].id != previous.id:
+            idx += 1
+        if previous.effective_date == transaction.effective_date:
+            txs[idx] = transaction
+            return
+        del txs[idx]
+    # Ties on effective_date are kept newest-first by first-save order, so a re-saved
+    # transaction returns to its original place among them.
+    date = transaction.effective_date
+    order = seq[transaction.id]
+    idx = bisect_left(txs, date, key=_tx_date_key)
+    while idx < len(txs) and txs[idx].effective_date == date and seq[txs[idx].id] > order:
+        idx += 1
+    txs.insert(idx, transaction)
 
 
 class MemoryStorage(StorageBackend):
     def __init__(self) -> None:
         self._accounts: dict[AccountId, Account] = {}
         self._accounts_by_code: dict[str, AccountId] = {}
+        self._accounts_sorted: list[Account] = []
+        self._accounts_by_currency: dict[str, list[Account]] = {}
         self._transactions: dict[TransactionId, Transaction] = {}
+        self._tx_seq: dict[TransactionId, int] = {}
+        self._tx_by_date: list[Transaction] = []
+        self._slot_of: dict[AccountId, int] = {}
+        self._tx_by_account: list[list[Transaction]] = []
+        self._books: list[dict[int, int]] = []
+        self._posted_entries: list[list[tuple[datetime, int, int]]] = []
+        self._prefix_debit: list[list[int]] = []
+        self._prefix_credit: list[list[int]] = []
 
     async def save_account(self, account: Account) -> None:
         if account.id in self._accounts:
@@ -24,10 +83,44 @@ class MemoryStorage(StorageBackend):
 
         self._accounts[account.id] = account
         self._accounts_by_code[account.code] = account.id
+        self._index_account(account)
+        self._slot(account.id)
+
+    def _index_account(self, account: Account) -> None:
+        _insert_account(self._accounts_sorted, account)
+        _insert_account(self._accounts_by_currency.setdefault(account.currency_code, []), account)
+
+    def _unindex_account(self, account: Account) -> None:
+        _remove_account(self._accounts_sorted, account)
+        _remove_account(self._accounts_by_currency[account.currency_code], account)
+
+    def _slot(self, account_id: AccountId) -> int:
+        slot = self._slot_of.get(account_id)
+        if slot is None:
+            slot = self._slot_of[account_id] = len(self._tx_by_account)
+            self._tx_by_account.append([])
+            self._books.append({})
+        return slot
+
+    def _slots(self, transaction: Transaction) -> list[int]:
+        return [self._slot(account_id) for account_id in transaction.columns.account_ids]
+
+    def _book(self, slot: int, decimal_places: int) -> int:
+        books = self._books[slot]
+        book = books.get(decimal_places)
+        if book is None:
+            book = books[decimal_places] = len(self._posted_entries)
+            self._posted_entries.append([])
+            self._prefix_debit.append([0])
+            self._prefix_credit.append([0])
+        return book
 
     async def get_account(self, account_id: AccountId) -> Account | None:
         return self._accounts.get(account_id)
 
+    async def accounts_exist(self, account_ids: Iterable[AccountId]) -> set[AccountId]:
+        return self._accounts.keys() & set(account_ids)
+
     async def get_account_by_code(self, code: str) -> Account | None:
         account_id = self._accounts_by_code.get(code)
         return self._accounts.get(account_id) if account_id else None
@@ -35,12 +128,13 @@ class MemoryStorage(StorageBackend):
     async def list_accounts(
         self, *, is_active: bool | None = None, currency_code: str | None = None
     ) -> list[Account]:
-        accounts = list(self._accounts.values())
-        if is_active is not None:
-            accounts = [a for a in accounts if a.is_active == is_active]
         if currency_code is not None:
-            accounts = [a for a in accounts if a.currency_code == currency_code]
-        return sorted(accounts, key=lambda a: a.code)
+            accounts = self._accounts_by_currency.get(currency_code.upper(), [])
+        else:
+            accounts = self._accounts_sorted
+        if is_active is not None:
+            return [a for a in accounts if a.is_active == is_active]
+        return list(accounts)
 
     async def update_account(self, account: Account) -> None:
         if account.id not in self._accounts:
@@ -51,10 +145,105 @@ class MemoryStorage(StorageBackend):
             del self._accounts_by_code[old_account.code]
             self._accounts_by_code[account.code] = account.id
 
+        self._unindex_account(old_account)
+        self._index_account(account)
         self._accounts[account.id] = account
 
     async def save_transaction(self, transaction: Transaction) -> None:
+        self._store_transaction(transaction)
+
+    async def save_transactions(self, transactions: Sequence[Transaction]) -> None:
+        for transaction in transactions:
+            self._store_transaction(transaction)
+
+    def _store_transaction(self, transaction: Transaction) -> None:
+        previous = self._transactions.get(transaction.id)
         self._transactions[transaction.id] = transaction
+        if previous is None:
+            self._tx_seq[transaction.id] = len(self._tx_seq)
+        slots = self._slots(transaction)
+        previous_slots = self._slots(previous) if previous is not None else []
+        self._index_transaction(previous, previous_slots, transaction, slots)
+        self._index_balances(previous, previous_slots, transaction, slots)
+
+    def _index_transaction(
+        self,
+        previous: Transaction | None,
+        previous_slots: list[int],
+        transaction: Transaction,
+        slots: list[int],
+    ) -> None:
+        _place_transaction(self._tx_by_date, previous, transaction, self._tx_seq)
+
+        old_slots = set(previous_slots)
+        new_slots = set(slots)
+        for slot in old_slots - new_slots:
+            txs = self._tx_by_account[slot]
+            txs.remove(next(t for t in txs if t.id == transaction.id))
+        for slot in new_slots:
+            _place_transaction(
+                self._tx_by_account[slot],
+                previous if slot in old_slots else None,
+                transaction,
+                self._tx_seq,
+            )
+
+    def _index_balances(
+        self,
+        previous: Transaction | None,
+        previous_slots: list[int],
+        transaction: Transaction,
+        slots: list[int],
+    ) -> None:
+        if previous is not None and previous.status is TransactionStatus.POSTED:
+            if (
+                transaction.status is TransactionStatus.POSTED
+                and transaction.effective_date == previous.effective_date
+                and transaction.entries == previous.entries
+            ):
+                return
+            self._unindex_posted(previous, previous_slots)
+        if transaction.status is TransactionStatus.POSTED:
+            self._index_posted(transaction, slots)
+
+    def _index_posted(self, transaction: Transaction, slots: list[int]) -> None:
+        date = transaction.effective_date
+        places = transaction.decimal_places
+        for slot, row in zip(slots, _posted_rows(transaction), strict=True):
+            book = self._book(slot, places)
+            rows = self._posted_entries[book]
+            if not rows or rows[-1][0] <= date:
+                rows.append(row)
+                debits = self._prefix_debit[book]
+                credits = self._prefix_credit[book]
+                debits.append(debits[-1] + row[1])
+                credits.append(credits[-1] + row[2])
+            else:
+                idx = bisect_right(rows, date, key=_date_key)
+                rows.insert(idx, row)
+                self._rebuild_prefix(book, idx)
+
+    def _unindex_posted(self, transaction: Transaction, slots: list[int]) -> None:
+        date = transaction.effective_date
+        places = transaction.decimal_places
+        for slot, row in zip(slots, _posted_rows(transaction), strict=True):
+            book = self._books[slot][places]
+            rows = self._posted_entries[book]
+            lo = bisect_left(rows, date, key=_date_key)
+            idx = rows.index(row, lo)
+            del rows[idx]
+            self._rebuild_prefix(book, idx)
+
+    def _rebuild_prefix(self, book: int, start: int) -> None:
+        rows = self._posted_entries[book]
+        debits = self._prefix_debit[book]
+        credits = self._prefix_credit[book]
+        debits[start:] = accumulate(
+            map(_debit_key, islice(rows, start, None)), initial=debits[start]
+        )
+        credits[start:] = accumulate(
+            map(_credit_key, islice(rows, start, None)), initial=credits[start]
+        )
 
     async def get_transaction(self, transaction_id: TransactionId) -> Transaction | None:
         return self._transactions.get(transaction_id)
@@ -68,17 +257,18 @@ class MemoryStorage(StorageBackend):
         limit: int = 100,
         offset: int = 0,
     ) -> list[Transaction]:
-        txs = list(self._transactions.values())
-
         if account_id is not None:
-            txs = [t for t in txs if any(e.account_id == account_id for e in t.entries)]
-        if start_date is not None:
-            txs = [t for t in txs if t.effective_date >= start_date]
-        if end_date is not None:
-            txs = [t for t in txs if t.effective_date <= end_date]
+            slot = self._slot_of.get(account_id)
+            txs = self._tx_by_account[slot] if slot is not None else []
+        else:
+            txs = self._tx_by_date
 
-        txs.sort(key=lambda t: t.effective_date, reverse=True)
-        return txs[offset : offset + limit]
+        lo = bisect_left(txs, start_date, key=_tx_date_key) if start_date is not None else 0
+        hi = bisect_right(txs, end_date, key=_tx_date_key) if end_date is not None else len(txs)
+        stop = hi - offset
+        if stop <= lo:
+            return []
+        return txs[max(lo, stop - limit) : stop][::-1]
 
     async def get_account_balance(
         self, account_id: AccountId, as_of: datetime | None = None
@@ -88,18 +278,11 @@ class MemoryStorage(StorageBackend):
             raise AccountNotFoundError(account_id)
 
         as_of = as_of or datetime.now(UTC)
-        debit_total = Decimal("0")
-        credit_total = Decimal("0")
-
-        for tx in self._transactions.values():
-            if tx.status != TransactionStatus.POSTED or tx.effective_date > as_of:
-                continue
-            for entry in tx.entries:
-                if entry.account_id == account_id:
-                    if entry.entry_type == EntryType.DEBIT:
-                        debit_total += entry.amount
-                    else:
-                        credit_total += entry.amount
+        debit_total = credit_total = ZERO
+        for places, book in self._books[self._slot(account_id)].items():
+            idx = bisect_right(self._posted_entries[book], as_of, key=_date_key)
+            debit_total += from_minor_units(self._prefix_debit[book][idx], places)
+            credit_total += from_minor_units(self._prefix_credit[book][idx], places)
 
         return AccountBalance(
             account_id=account_id,
@@ -115,4 +298,14 @@ class MemoryStorage(StorageBackend):
     def clear(self) -> None:
         self._accounts.clear()
         self._accounts_by_code.clear()
+        self._accounts_sorted.clear()
+        self._accounts_by_currency.clear()
         self._transactions.clear()
+        self._tx_seq.clear()
+        self._tx_by_date.clear()
+        self._slot_of.clear()
+        self._tx_by_account.clear()
+        self._books.clear()
+        self._posted_entries.clear()
+        self._prefix_debit.clear()
+        self._prefix_credit.clear()
@@ -1,39 +1,151 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
 from decimal import Decimal
-from typing import Any, Self
+from itertools import compress
+from operator import attrgetter
+from typing import Any, NamedTuple, Self
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
+from siphra import _clock
+from siphra._coerce import as_decimal, as_member, as_uuid
+from siphra.currency import decimal_places_for, from_minor_units, to_minor_units
 from siphra.exceptions import BalanceError, ValidationError
 from siphra.types import (
     AccountId,
     EntryId,
     EntryType,
     Metadata,
+    MinorUnits,
     Timestamp,
     TransactionId,
     TransactionStatus,
 )
 
-ZERO = Decimal("0")
+_DEBIT = EntryType.DEBIT
+_CREDIT = EntryType.CREDIT
+_setattr = object.__setattr__
 
 
-class Entry(BaseModel):
-    model_config = ConfigDict(frozen=True)
+def _currency_code(code: str) -> str:
+    if not 3 <= len(code) <= 4:
+        raise ValidationError(f"Invalid currency code: {code!r}")
+    return sys.intern(code.upper())
+
+
+def _minor_amount(amount: Decimal, decimal_places: int) -> MinorUnits:
+    minor = to_minor_units(amount, decimal_places)
+    if minor <= 0:
+        raise ValidationError(f"Entry amount must be positive: {amount}")
+    return minor
 
-    id: EntryId = Field(default_factory=lambda: EntryId(uuid4()))
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Entry:
+    id: EntryId = field(default_factory=lambda: EntryId(uuid4()))
     account_id: AccountId
     entry_type: EntryType
-    amount: Decimal = Field(gt=ZERO)
-    currency_code: str = Field(min_length=3, max_length=4)
-    description: str = Field(default="", max_length=500)
+    amount: Decimal
+    currency_code: str
+    description: str = ""
+    decimal_places: int = field(init=False, repr=False, compare=False)
+    amount_minor: MinorUnits = field(init=False, repr=False, compare=False)
+    is_debit: bool = field(init=False, repr=False, compare=False)
+    signed_amount: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "id", EntryId(as_uuid(self.id, "entry id")))
+        object.__setattr__(self, "account_id", AccountId(as_uuid(self.account_id, "account id")))
+        object.__setattr__(self, "entry_type", as_member(EntryType, self.entry_type))
+        object.__setattr__(self, "amount", as_decimal(self.amount, "amount"))
+        object.__setattr__(self, "currency_code", _currency_code(self.currency_code))
+        if len(self.description) > 500:
+            raise ValidationError("Entry description exceeds 500 characters")
+        places = decimal_places_for(self.currency_code)
+        object.__setattr__(self, "decimal_places", places)
+        object.__setattr__(self, "amount_minor", _minor_amount(self.amount, places))
+        is_debit = self.entry_type is _DEBIT
+        object.__setattr__(self, "is_debit", is_debit)
+        object.__setattr__(self, "signed_amount", self.amount if is_debit else -self.amount)
 
     @property
-    def signed_amount(self) -> Decimal:
-        return self.amount if self.entry_type == EntryType.DEBIT else -self.amount
+    def is_credit(self) -> bool:
+        return not self.is_debit
+
+    def _mirror(self) -> Entry:
+        return _new_entry(
+            self.account_id,
+            _CREDIT if self.is_debit else _DEBIT,
+            self.amount,
+            self.currency_code,
+            self.decimal_places,
+            self.amount_minor,
+        )
+
+
+def _new_entry(
+    account_id: AccountId,
+    entry_type: EntryType,
+    amount: Decimal,
+    currency_code: str,
+    decimal_places: int,
+    amount_minor: MinorUnits,
+) -> Entry:
+    is_debit = entry_type is _DEBIT
+    entry = object.__new__(Entry)
+    _setattr(entry, "id", EntryId(uuid4()))
+    _setattr(entry, "account_id", account_id)
+    _setattr(entry, "entry_type", entry_type)
+    _setattr(entry, "amount", amount)
+    _setattr(entry, "currency_code", currency_code)
+    _setattr(entry, "description", "")
+    _setattr(entry, "decimal_places", decimal_places)
+    _setattr(entry, "amount_minor", amount_minor)
+    _setattr(entry, "is_debit", is_debit)
+    _setattr(entry, "signed_amount", amount if is_debit else -amount)
+    return entry
+
+
+class EntryColumns(NamedTuple):
+    account_ids: tuple[AccountId, ...]
+    amounts_minor: tuple[MinorUnits, ...]
+    debit_flags: tuple[bool, ...]
+
+
+_account_id = attrgetter("account_id")
+_amount_minor = attrgetter("amount_minor")
+_is_debit = attrgetter("is_debit")
+
+
+def _tally(entries: tuple[Entry, ...]) -> tuple[EntryColumns, Decimal, Decimal]:
+    currency = entries[0].currency_code
+    places = entries[0].decimal_places
+    for e in entries:
+        if e.currency_code is not currency and e.currency_code != currency:
+            raise ValidationError(f"Mixed currencies not allowed: {currency} vs {e.currency_code}")
+        if e.decimal_places != places:
+            raise ValidationError(f"Entries disagree on decimal places for {currency}")
+    columns = EntryColumns(
+        tuple(map(_account_id, entries)),
+        tuple(map(_amount_minor, entries)),
+        tuple(map(_is_debit, entries)),
+    )
+    debits = sum(compress(columns.amounts_minor, columns.debit_flags))
+    credits = sum(columns.amounts_minor) - debits
+    debit_total = from_minor_units(debits, places)
+    credit_total = from_minor_units(credits, places)
+    if debits != credits:
+        raise BalanceError(
+            f"Unbalanced: debits={debit_total}, credits={credit_total}",
+            debit_total,
+            credit_total,
+        )
+    return columns, debit_total, credit_total
 
 
 class Transaction(BaseModel):
@@ -43,91 +155,178 @@ class Transaction(BaseModel):
     entries: tuple[Entry, ...] = Field(min_length=2)
     description: str = Field(default="", max_length=1000)
     reference: str = Field(default="", max_length=100)
-    effective_date: Timestamp = Field(default_factory=lambda: datetime.now(UTC))
+    effective_date: Timestamp = Field(default_factory=_clock.current_now)
     status: TransactionStatus = TransactionStatus.PENDING
     metadata: Metadata = Field(default_factory=dict)
-    created_at: Timestamp = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: Timestamp = Field(default_factory=_clock.current_now)
     posted_at: Timestamp | None = None
 
+    _columns: EntryColumns | None = PrivateAttr(default=None)
+    _debit_total: Decimal | None = PrivateAttr(default=None)
+    _credit_total: Decimal | None = PrivateAttr(default=None)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _stamp(cls, data: Any) -> Any:
+        if isinstance(data, dict) and not ("created_at" in data and "effective_date" in data):
+            now = _clock.current_now()
+            data = {"effective_date": now, "created_at": now, **data}
+        return data
+
     @model_validator(mode="after")
     def _check_balance(self) -> Self:
-        debits = sum((e.amount for e in self.entries if e.entry_type == EntryType.DEBIT), ZERO)
-        credits = sum((e.amount for e in self.entries if e.entry_type == EntryType.CREDIT), ZERO)
-        if debits != credits:
-            raise BalanceError(f"Unbalanced: debits={debits}, credits={credits}", debits, credits)
+        self._fill()
         return self
 
-    @model_validator(mode="after")
-    def _check_single_currency(self) -> Self:
-        currencies = {e.currency_code for e in self.entries}
-        if len(currencies) > 1:
-            raise ValidationError(f"Mixed currencies not allowed: {currencies}")
-        return self
+    def __eq__(self, other: object) -> bool:
+        # The private caches derive from entries and may not be filled yet.
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def _fill(self) -> tuple[EntryColumns, Decimal, Decimal]:
+        tally = _tally(self.entries)
+        self._columns, self._debit_total, self._credit_total = tally
+        return tally
+
+    @property
+    def columns(self) -> EntryColumns:
+        columns = self._columns
+        if columns is None:
+            columns = self._fill()[0]
+        return columns
+
+    @property
+    def debit_total(self) -> Decimal:
+        total = self._debit_total
+        if total is None:
+            total = self._fill()[1]
+        return total
+
+    @property
+    def credit_total(self) -> Decimal:
+        total = self._credit_total
+        if total is None:
+            total = self._fill()[2]
+        return total
 
     @property
     def amount(self) -> Decimal:
-        return sum((e.amount for e in self.entries if e.entry_type == EntryType.DEBIT), ZERO)
+        return self.debit_total
 
     @property
     def currency_code(self) -> str:
         return self.entries[0].currency_code
 
+    @property
+    def decimal_places(self) -> int:
+        return self.entries[0].decimal_places
+
     @property
     def is_posted(self) -> bool:
-        return self.status == TransactionStatus.POSTED
+        return self.status is TransactionStatus.POSTED
 
     def post(self) -> Self:
-        if self.status != TransactionStatus.PENDING:
+        if self.status is not TransactionStatus.PENDING:
             raise ValidationError(f"Cannot post transaction with status {self.status}")
         return self.model_copy(
-            update={"status": TransactionStatus.POSTED, "posted_at": datetime.now(UTC)}
+            update={"status": TransactionStatus.POSTED, "posted_at": _clock.current_now()}
         )
 
     def reverse(self, description: str | None = None) -> Transaction:
-        if self.status != TransactionStatus.POSTED:
+        if self.status is not TransactionStatus.POSTED:
             raise ValidationError("Can only reverse posted transactions")
 
-        def flip(t: EntryType) -> EntryType:
-            return EntryType.CREDIT if t == EntryType.DEBIT else EntryType.DEBIT
-
-        return Transaction(
-            entries=tuple(
-                Entry(
-                    account_id=e.account_id,
-                    entry_type=flip(e.entry_type),
-                    amount=e.amount,
-                    currency_code=e.currency_code,
-                )
-                for e in self.entries
-            ),
-            description=description or f"Reversal of: {self.description}",
-            reference=f"REV-{self.reference}" if self.reference else "",
+        description = description or f"Reversal of: {self.description}"
+        reference = f"REV-{self.reference}" if self.reference else ""
+        if len(description) > 1000:
+            raise ValidationError("Reversal description exceeds 1000 characters")
+        if len(reference) > 100:
+            raise ValidationError("Reversal reference exceeds 100 characters")
+
+        now = _clock.current_now()
+        # The source is balanced and single-currency, so the mirror image is too.
+        reversal = Transaction.model_construct(
+            entries=tuple([e._mirror() for e in self.entries]),
+            description=description,
+            reference=reference,
             metadata={"reversed_transaction_id": str(self.id)},
+            effective_date=now,
+            created_at=now,
+        )
+        columns = self.columns
+        reversal._columns = columns._replace(
+            debit_flags=tuple(not flag for flag in columns.debit_flags)
         )
+        reversal._debit_total = self.credit_total
+        reversal._credit_total = self.debit_total
+        return reversal
 
 
 class TransactionBuilder:
-    __slots__ = ("_desc", "_effective", "_entries", "_meta", "_ref")
+    __slots__ = (
+        "_code",
+        "_currency",
+        "_desc",
+        "_effective",
+        "_entries",
+        "_meta",
+        "_places",
+        "_ref",
+    )
 
     def __init__(self, description: str = "", reference: str = "") -> None:
         self._desc = description
         self._ref = reference
         self._entries: list[Entry] = []
-        self._meta: Metadata = {}
+        self._meta: Metadata | None = None
         self._effective: datetime | None = None
+        self._currency: str | None = None
+        self._code = ""
+        self._places = 0
+
+    def _use_currency(self, currency: str) -> None:
+        if currency != self._currency:
+            self._code = _currency_code(currency)
+            self._places = decimal_places_for(self._code)
+            self._currency = currency
 
     def _add(self, kind: EntryType, account: AccountId, amount: Decimal, currency: str) -> Self:
-        entry = Entry(account_id=account, entry_type=kind, amount=amount, currency_code=currency)
-        self._entries.append(entry)
+        self._use_currency(currency)
+        account = AccountId(as_uuid(account, "account id"))
+        amount = as_decimal(amount, "amount")
+        minor = _minor_amount(amount, self._places)
+        self._entries.append(_new_entry(account, kind, amount, self._code, self._places, minor))
+        return self
+
+    def _extend(
+        self, kind: EntryType, items: Iterable[tuple[AccountId, Decimal]], currency: str
+    ) -> Self:
+        self._use_currency(currency)
+        code, places = self._code, self._places
+        append = self._entries.append
+        for account, amount in items:
+            account = AccountId(as_uuid(account, "account id"))
+            amount = as_decimal(amount, "amount")
+            minor = _minor_amount(amount, places)
+            append(_new_entry(account, kind, amount, code, places, minor))
         return self
 
     def debit(self, account: AccountId, amount: Decimal, currency: str) -> Self:
-        return self._add(EntryType.DEBIT, account, amount, currency)
+        return self._add(_DEBIT, account, amount, currency)
 
     def credit(self, account: AccountId, amount: Decimal, currency: str) -> Self:
-        return self._add(EntryType.CREDIT, account, amount, currency)
+        return self._add(_CREDIT, account, amount, currency)
+
+    def debits(self, items: Iterable[tuple[AccountId, Decimal]], currency: str) -> Self:
+        return self._extend(_DEBIT, items, currency)
+
+    def credits(self, items: Iterable[tuple[AccountId, Decimal]], currency: str) -> Self:
+        return self._extend(_CREDIT, items, currency)
 
     def meta(self, key: str, value: str | int | float | bool | None) -> Self:
+        if self._meta is None:
+            self._meta = {}
         self._meta[key] = value
         return self
 
@@ -136,12 +335,24 @@ class TransactionBuilder:
         return self
 
     def build(self) -> Transaction:
-        kwargs: dict[str, Any] = {
-            "entries": tuple(self._entries),
-            "description": self._desc,
-            "reference": self._ref,
-            "metadata": self._meta,
-        }
-        if self._effective:
-            kwargs["effective_date"] = self._effective
-        return Transaction(**kwargs)
+        entries = tuple(self._entries)
+        if len(entries) < 2:
+            raise ValidationError("Transaction requires at least 2 entries")
+        if len(self._desc) > 1000:
+            raise ValidationError("Transaction description exceeds 1000 characters")
+        if len(self._ref) > 100:
+            raise ValidationError("Transaction reference exceeds 100 characters")
+        columns, debit_total, credit_total = _tally(entries)
+        now = _clock.current_now()
+        transaction = Transaction.model_construct(
+            entries=entries,
+            description=self._desc,
+            reference=self._ref,
+            effective_date=self._effective or now,
+            metadata=dict(self._meta) if self._meta else {},
+            created_at=now,
+        )
+        transaction._columns = columns
+        transaction._debit_total = debit_total
+        transaction._credit_total = credit_total
+        return transaction
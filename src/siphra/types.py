@@ -14,6 +14,7 @@ EntryId = NewType("EntryId", UUID)
 LedgerId = NewType("LedgerId", UUID)
 
 MoneyAmount = Annotated[Decimal, Field(decimal_places=8)]
+MinorUnits = NewType("MinorUnits", int)
 
 
 class AccountType(str, Enum):
@@ -0,0 +1,42 @@
+"""Tests for the Account model."""
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from siphra import Account, AccountType, ValidationError
+
+
+class TestAccountValidation:
+    """Tests for account field coercion and validation."""
+
+    def test_string_ids_become_uuids(self):
+        """Test that id and parent_id given as strings are stored as UUIDs."""
+        account_id, parent_id = uuid4(), uuid4()
+
+        account = Account(
+            id=str(account_id),
+            code="1000",
+            name="Cash",
+            account_type="asset",
+            currency_code="usd",
+            parent_id=str(parent_id),
+        )
+
+        assert account.id == account_id
+        assert account.parent_id == parent_id
+        assert isinstance(account.id, UUID) and isinstance(account.parent_id, UUID)
+        assert account.account_type is AccountType.ASSET
+
+    def test_invalid_fields_raise_validation_error(self):
+        """Test that malformed ids and account types raise ValidationError."""
+        with pytest.raises(ValidationError, match="parent id"):
+            Account(
+                code="1000",
+                name="Cash",
+                account_type=AccountType.ASSET,
+                currency_code="USD",
+                parent_id="nope",
+            )
+        with pytest.raises(ValidationError, match="Invalid AccountType"):
+            Account(code="1000", name="Cash", account_type="cash", currency_code="USD")
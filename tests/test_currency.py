@@ -0,0 +1,25 @@
+"""Tests for currencies and the currency registry."""
+
+from decimal import Decimal
+
+from siphra import CurrencyRegistry
+
+
+class TestCurrency:
+    """Tests for rounding and formatting amounts."""
+
+    def test_round_amount(self):
+        """Test rounding half-up to the currency's decimal places."""
+        usd = CurrencyRegistry.get("USD")
+        jpy = CurrencyRegistry.get("JPY")
+        assert usd is not None and jpy is not None
+
+        assert usd.round_amount(Decimal("10.005")) == Decimal("10.01")
+        assert jpy.round_amount(Decimal("10.5")) == Decimal("11")
+
+    def test_format_amount(self):
+        """Test thousands separators and currency symbols."""
+        usd = CurrencyRegistry.get("usd")
+        assert usd is not None
+
+        assert usd.format_amount(Decimal("1234567.125")) == "$1,234,567.13"
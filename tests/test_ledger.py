@@ -1,10 +1,26 @@
 """Tests for the Ledger class."""
 
+from datetime import UTC, datetime
 from decimal import Decimal
+from uuid import uuid4
 
 import pytest
 
-from siphra import AccountType, BalanceError, Ledger
+from siphra import (
+    AccountId,
+    AccountNotFoundError,
+    AccountType,
+    BalanceError,
+    Currency,
+    CurrencyRegistry,
+    Ledger,
+    Transaction,
+    TransactionBuilder,
+    TransactionStatus,
+    ValidationError,
+    currency,
+)
+from siphra.storage import MemoryStorage
 
 
 class TestLedgerAccounts:
@@ -46,6 +62,23 @@ class TestLedgerAccounts:
         active_accounts = await ledger.list_accounts(is_active=True)
         assert len(active_accounts) == 2
 
+    async def test_list_accounts_after_update(self, ledger: Ledger):
+        """Test that listings stay ordered by code and reflect updates."""
+        payables = await ledger.create_account("2000", "Payables", AccountType.LIABILITY)
+        await ledger.create_account("1000", "Cash", AccountType.ASSET)
+        await ledger.create_account("1010", "Euro Cash", AccountType.ASSET, currency_code="EUR")
+
+        await ledger.update_account(payables.id, is_active=False)
+
+        all_accounts = await ledger.list_accounts()
+        assert [a.code for a in all_accounts] == ["1000", "1010", "2000"]
+
+        active_usd = await ledger.list_accounts(is_active=True, currency_code="usd")
+        assert [a.code for a in active_usd] == ["1000"]
+
+        inactive = await ledger.list_accounts(is_active=False)
+        assert [a.name for a in inactive] == ["Payables"]
+
 
 class TestLedgerTransactions:
     """Tests for transaction operations."""
@@ -95,8 +128,108 @@ class TestLedgerTransactions:
         )
 
         assert tx.amount == Decimal("100.00")
+        assert tx.debit_total == tx.credit_total == Decimal("100.00")
         assert len(tx.entries) == 3
 
+    async def test_unknown_account_fails(self, ledger: Ledger):
+        """Test that entries against missing accounts are rejected."""
+        cash = await ledger.create_account("1000", "Cash", AccountType.ASSET)
+        missing = AccountId(uuid4())
+
+        with pytest.raises(AccountNotFoundError) as exc_info:
+            await ledger.record_transaction(
+                description="Ghost",
+                debits=[(cash.id, Decimal("10.00"))],
+                credits=[(missing, Decimal("10.00"))],
+            )
+        assert exc_info.value.account_id == missing
+
+    async def test_amount_precision_exceeds_currency(self, ledger: Ledger):
+        """Test that amounts finer than the currency's minor unit are rejected."""
+        cash = await ledger.create_account("1000", "Cash", AccountType.ASSET)
+        revenue = await ledger.create_account("4000", "Revenue", AccountType.REVENUE)
+
+        with pytest.raises(ValidationError):
+            await ledger.record_transaction(
+                description="Sub-cent",
+                debits=[(cash.id, Decimal("10.005"))],
+                credits=[(revenue.id, Decimal("10.005"))],
+            )
+
+    async def test_list_transactions_by_account(self, ledger: Ledger):
+        """Test filtering, ordering and paging of transaction listings."""
+        cash = await ledger.create_account("1000", "Cash", AccountType.ASSET)
+        bank = await ledger.create_account("1010", "Bank", AccountType.ASSET)
+        revenue = await ledger.create_account("4000", "Revenue", AccountType.REVENUE)
+
+        for day in (3, 1, 2):
+            await ledger.record_transaction(
+                description=f"Cash {day}",
+                debits=[(cash.id, Decimal("10.00"))],
+                credits=[(revenue.id, Decimal("10.00"))],
+                effective_date=datetime(2024, 1, day, tzinfo=UTC),
+            )
+        await ledger.record_transaction(
+            description="Bank",
+            debits=[(bank.id, Decimal("10.00"))],
+            credits=[(revenue.id, Decimal("10.00"))],
+            effective_date=datetime(2024, 1, 2, tzinfo=UTC),
+        )
+
+        cash_txs = await ledger.list_transactions(account_id=cash.id)
+        assert [t.description for t in cash_txs] == ["Cash 3", "Cash 2", "Cash 1"]
+
+        page = await ledger.list_transactions(
+            account_id=revenue.id,
+            start_date=datetime(2024, 1, 2, tzinfo=UTC),
+            limit=2,
+            offset=1,
+        )
+        assert [t.description for t in page] == ["Cash 2", "Bank"]
+
+    async def test_resave_keeps_order_among_ties(
+        self, ledger: Ledger, memory_storage: MemoryStorage
+    ):
+        """Test that moving a transaction onto another date keeps first-save order in ties."""
+        cash = await ledger.create_account("1000", "Cash", AccountType.ASSET)
+        revenue = await ledger.create_account("4000", "Revenue", AccountType.REVENUE)
+
+        for name, day in (("A", 1), ("B", 2), ("C", 2)):
+            await ledger.record_transaction(
+                description=name,
+                debits=[(cash.id, Decimal("1.00"))],
+                credits=[(revenue.id, Decimal("1.00"))],
+                effective_date=datetime(2024, 1, day, tzinfo=UTC),
+            )
+        moved = (await ledger.list_transactions())[-1]
+        await memory_storage.save_transaction(
+            moved.model_copy(update={"effective_date": datetime(2024, 1, 2, tzinfo=UTC)})
+        )
+
+        listed = await ledger.list_transactions(account_id=cash.id)
+        assert [t.description for t in listed] == ["A", "B", "C"]
+
+    async def test_saved_constructed_transaction_is_indexed(
+        self, ledger: Ledger, memory_storage: MemoryStorage
+    ):
+        """Test that transactions built without validation still reach the indexes."""
+        cash = await ledger.create_account("1000", "Cash", AccountType.ASSET)
+        revenue = await ledger.create_account("4000", "Revenue", AccountType.REVENUE)
+        entries = (
+            TransactionBuilder("Sale")
+            .debit(cash.id, Decimal("5.00"), "USD")
+            .credit(revenue.id, Decimal("5.00"), "USD")
+            .build()
+            .entries
+        )
+
+        await memory_storage.save_transaction(
+            Transaction.model_construct(entries=entries, status=TransactionStatus.POSTED)
+        )
+
+        assert await ledger.get_balance(cash.id) == Decimal("5.00")
+        assert len(await ledger.list_transactions(account_id=cash.id)) == 1
+
 
 class TestLedgerBalances:
     """Tests for balance calculations."""
@@ -149,3 +282,57 @@ class TestLedgerBalances:
         assert cash_balance == Decimal("0")
         assert revenue_balance == Decimal("0")
         assert reversal.description.startswith("Void:")
+
+    async def test_balance_as_of(self, ledger: Ledger):
+        """Test point-in-time balances with out-of-order effective dates."""
+        cash = await ledger.create_account("1000", "Cash", AccountType.ASSET)
+        revenue = await ledger.create_account("4000", "Revenue", AccountType.REVENUE)
+
+        for day, amount in ((20, "30.00"), (5, "10.00"), (12, "20.00")):
+            await ledger.record_transaction(
+                description=f"Sale {day}",
+                debits=[(cash.id, Decimal(amount))],
+                credits=[(revenue.id, Decimal(amount))],
+                effective_date=datetime(2024, 1, day, tzinfo=UTC),
+            )
+
+        before = await ledger.get_balance(cash.id, datetime(2024, 1, 1, tzinfo=UTC))
+        midway = await ledger.get_balance(cash.id, datetime(2024, 1, 12, tzinfo=UTC))
+
+        assert before == Decimal("0")
+        assert midway == Decimal("30.00")
+        assert await ledger.get_balance(revenue.id) == Decimal("60.00")
+
+    async def test_balance_in_other_currency(self, ledger: Ledger):
+        """Test that entries keep their own currency's scale in an account's balance."""
+        yen = await ledger.create_account(
+            "1020", "Yen Cash", AccountType.ASSET, currency_code="JPY"
+        )
+        revenue = await ledger.create_account("4000", "Revenue", AccountType.REVENUE)
+
+        await ledger.record_transaction(
+            description="Sale",
+            debits=[(yen.id, Decimal("100.00"))],
+            credits=[(revenue.id, Decimal("100.00"))],
+        )
+
+        assert await ledger.get_balance(yen.id) == Decimal("100.00")
+
+    async def test_balance_survives_currency_registration(
+        self, ledger: Ledger, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that registering a currency later does not rescale posted amounts."""
+        monkeypatch.setattr(currency, "_CURRENCIES", dict(currency._CURRENCIES))
+        monkeypatch.setattr(currency, "_DECIMAL_PLACES", dict(currency._DECIMAL_PLACES))
+        cash = await ledger.create_account("1000", "Cash", AccountType.ASSET, currency_code="XYZ")
+        revenue = await ledger.create_account("4000", "Revenue", AccountType.REVENUE)
+
+        await ledger.record_transaction(
+            description="Sale",
+            debits=[(cash.id, Decimal("5"))],
+            credits=[(revenue.id, Decimal("5"))],
+            currency_code="XYZ",
+        )
+        CurrencyRegistry.register(Currency(code="XYZ", name="Test", decimal_places=2))
+
+        assert await ledger.get_balance(cash.id) == Decimal("5")
@@ -0,0 +1,231 @@
+"""Tests for Transaction and TransactionBuilder."""
+
+from dataclasses import replace
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from siphra import (
+    AccountId,
+    Entry,
+    EntryType,
+    Transaction,
+    TransactionBuilder,
+    TransactionStatus,
+    ValidationError,
+)
+
+
+@pytest.fixture
+def accounts() -> tuple[AccountId, AccountId]:
+    return AccountId(uuid4()), AccountId(uuid4())
+
+
+class TestTransactionLifecycle:
+    """Tests for posting and reversing transactions."""
+
+    def test_post_keeps_computed_state(self, accounts: tuple[AccountId, AccountId]):
+        """Test that posting carries totals and columns over without revalidating."""
+        cash, revenue = accounts
+        tx = (
+            TransactionBuilder("Sale")
+            .debit(cash, Decimal("25.00"), "USD")
+            .credit(revenue, Decimal("25.00"), "USD")
+            .build()
+        )
+
+        posted = tx.post()
+
+        assert posted.status is TransactionStatus.POSTED
+        assert posted.posted_at is not None
+        assert posted.debit_total == posted.credit_total == Decimal("25.00")
+        assert posted.columns == tx.columns
+
+    def test_reverse_mirrors_entries(self, accounts: tuple[AccountId, AccountId]):
+        """Test that a reversal flips every entry and matches a validated rebuild."""
+        cash, revenue = accounts
+        tx = (
+            TransactionBuilder("Sale", reference="INV-1")
+            .debit(cash, Decimal("25.00"), "USD")
+            .credit(revenue, Decimal("20.00"), "USD")
+            .credit(revenue, Decimal("5.00"), "USD")
+            .build()
+            .post()
+        )
+
+        reversal = tx.reverse()
+        rebuilt = Transaction(entries=reversal.entries)
+
+        assert reversal.reference == "REV-INV-1"
+        assert reversal.status is TransactionStatus.PENDING
+        assert [e.is_debit for e in reversal.entries] == [False, True, True]
+        assert [(e.amount_minor, e.signed_amount) for e in reversal.entries] == [
+            (e.amount_minor, e.signed_amount) for e in map(replace, reversal.entries)
+        ]
+        assert reversal.columns == rebuilt.columns
+        assert reversal.debit_total == rebuilt.debit_total == Decimal("25.00")
+
+    def test_post_twice_fails(self, accounts: tuple[AccountId, AccountId]):
+        """Test that only pending transactions can be posted."""
+        cash, revenue = accounts
+        tx = (
+            TransactionBuilder("Sale")
+            .debit(cash, Decimal("25.00"), "USD")
+            .credit(revenue, Decimal("25.00"), "USD")
+            .build()
+            .post()
+        )
+
+        with pytest.raises(ValidationError):
+            tx.post()
+
+
+class TestTransactionValidation:
+    """Tests for balance and currency validation."""
+
+    def test_mixed_currencies_fail_before_balance(self, accounts: tuple[AccountId, AccountId]):
+        """Test that mixed currencies are reported even when amounts also differ."""
+        cash, revenue = accounts
+        builder = (
+            TransactionBuilder("Mixed")
+            .debit(cash, Decimal("100.00"), "USD")
+            .credit(revenue, Decimal("100"), "JPY")
+        )
+
+        with pytest.raises(ValidationError, match="Mixed currencies"):
+            builder.build()
+
+    def test_build_matches_validated_construction(self, accounts: tuple[AccountId, AccountId]):
+        """Test that the builder's fast path agrees with full model validation."""
+        cash, revenue = accounts
+        built = (
+            TransactionBuilder("Sale", reference="INV-2")
+            .debit(cash, Decimal("40.00"), "USD")
+            .credit(revenue, Decimal("40.00"), "USD")
+            .meta("channel", "web")
+            .build()
+        )
+        validated = Transaction.model_validate(built.model_dump())
+
+        assert validated == built
+        assert validated.columns == built.columns
+        assert validated.debit_total == built.debit_total
+
+    def test_build_requires_two_entries(self, accounts: tuple[AccountId, AccountId]):
+        """Test that the builder rejects single-entry transactions."""
+        cash, _ = accounts
+        builder = TransactionBuilder("Half").debit(cash, Decimal("1.00"), "USD")
+
+        with pytest.raises(ValidationError, match="at least 2 entries"):
+            builder.build()
+
+    def test_defaults_share_one_timestamp(self, accounts: tuple[AccountId, AccountId]):
+        """Test that created_at and a defaulted effective_date are the same instant."""
+        cash, revenue = accounts
+        built = (
+            TransactionBuilder("Sale")
+            .debit(cash, Decimal("1.00"), "USD")
+            .credit(revenue, Decimal("1.00"), "USD")
+            .build()
+        )
+        validated = Transaction(entries=built.entries)
+        reversal = built.post().reverse()
+
+        for tx in (built, validated, reversal):
+            assert tx.created_at == tx.effective_date
+
+    def test_builder_entries_match_validated_entries(self, accounts: tuple[AccountId, AccountId]):
+        """Test that builder-made entries carry the same derived state as validated ones."""
+        cash, revenue = accounts
+        tx = (
+            TransactionBuilder("Sale")
+            .debit(cash, Decimal("12.50"), "usd")
+            .credit(revenue, Decimal("12.50"), "usd")
+            .build()
+        )
+
+        for entry in tx.entries:
+            checked = replace(entry)
+            assert entry.currency_code == checked.currency_code == "USD"
+            assert entry.amount_minor == checked.amount_minor
+            assert entry.signed_amount == checked.signed_amount
+
+    def test_builder_rejects_non_positive_amounts(self, accounts: tuple[AccountId, AccountId]):
+        """Test that the builder applies the entry amount checks."""
+        cash, _ = accounts
+
+        with pytest.raises(ValidationError, match="must be positive"):
+            TransactionBuilder("Zero").debit(cash, Decimal("0"), "USD")
+        with pytest.raises(ValidationError, match="Invalid currency"):
+            TransactionBuilder("Bad").debit(cash, Decimal("1"), "US")
+
+    def test_bulk_entries_match_single_entries(self, accounts: tuple[AccountId, AccountId]):
+        """Test that debits()/credits() build the same entries as debit()/credit()."""
+        cash, revenue = accounts
+        lines = [(cash, Decimal("3.00")), (cash, Decimal("4.00"))]
+        bulk = TransactionBuilder("Bulk").debits(lines, "USD").credits([(revenue, 7)], "USD")
+        single = (
+            TransactionBuilder("Single")
+            .debit(cash, Decimal("3.00"), "USD")
+            .debit(cash, Decimal("4.00"), "USD")
+            .credit(revenue, Decimal("7"), "USD")
+        )
+
+        assert bulk.build().columns == single.build().columns
+
+    def test_model_construct_computes_totals(self, accounts: tuple[AccountId, AccountId]):
+        """Test that unvalidated construction still derives totals from the entries."""
+        cash, revenue = accounts
+        entries = (
+            TransactionBuilder("Sale")
+            .debit(cash, Decimal("8.00"), "USD")
+            .credit(revenue, Decimal("8.00"), "USD")
+            .build()
+            .entries
+        )
+
+        tx = Transaction.model_construct(entries=entries)
+
+        assert tx.amount == tx.debit_total == tx.credit_total == Decimal("8.00")
+        assert tx.columns.account_ids == (cash, revenue)
+
+    def test_entry_coerces_ids(self, accounts: tuple[AccountId, AccountId]):
+        """Test that string ids are converted to UUIDs and bad ones are rejected."""
+        cash, _ = accounts
+
+        entry = Entry(account_id=str(cash), entry_type="debit", amount="1.50", currency_code="USD")
+
+        assert entry.account_id == cash
+        assert isinstance(entry.account_id, UUID)
+        assert entry.entry_type is EntryType.DEBIT
+        with pytest.raises(ValidationError, match="account id"):
+            Entry(account_id="not-a-uuid", entry_type="debit", amount="1", currency_code="USD")
+
+    def test_entry_rejects_bad_amounts(self, accounts: tuple[AccountId, AccountId]):
+        """Test that unparseable amounts and entry types raise ValidationError."""
+        cash, _ = accounts
+
+        with pytest.raises(ValidationError, match="Invalid amount"):
+            Entry(account_id=cash, entry_type="debit", amount="abc", currency_code="USD")
+        with pytest.raises(ValidationError, match="Invalid EntryType"):
+            Entry(account_id=cash, entry_type="both", amount="1", currency_code="USD")
+        with pytest.raises(ValidationError, match="Invalid amount"):
+            TransactionBuilder("Bad").debit(cash, "abc", "USD")
+
+    def test_equality_ignores_cache_state(self, accounts: tuple[AccountId, AccountId]):
+        """Test that equality is the same before and after the cached totals are read."""
+        cash, revenue = accounts
+        built = (
+            TransactionBuilder("Sale")
+            .debit(cash, Decimal("6.00"), "USD")
+            .credit(revenue, Decimal("6.00"), "USD")
+            .build()
+        )
+        first = Transaction.model_construct(**dict(built))
+        second = Transaction.model_construct(**dict(built))
+
+        assert first == second == built
+        assert first.amount == Decimal("6.00")
+        assert first == second == built
+        assert second != built.post()